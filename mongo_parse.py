@@ -2,12 +2,24 @@
 
 import argparse
 import csv
-import re
+import mmap
+import os
+import re as stdlib_re
 import sys
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Match, Optional, Pattern, Tuple, Union
 import logging
 from pathlib import Path
 
+try:
+    # google-re2 matches in guaranteed linear time; fall back to the stdlib engine
+    import re2 as re  # type: ignore[import-not-found,import-untyped,no-redef]
+except ImportError:
+    import re
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,173 +29,705 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Regular expressions for parsing
-CLUSTER_REGEXES: Dict[str, str] = {
-    'replica_set_name': r'setName:\s*\'([^\']+)\'',
-    'hosts': r'hosts:\s*\[\s*([^\]]*)\s*\]',
-    'primary_host': r'primary:\s*\'([^\']+)\''
+CLUSTER_REGEXES: Dict[str, Pattern[str]] = {
+    'replica_set_name': re.compile(r'setName:\s*\'([^\']+)\''),
+    'hosts': re.compile(r'hosts:\s*\[\s*([^\]]*)\s*\]'),
+    'primary_host': re.compile(r'primary:\s*\'([^\']+)\'')
+}
+
+# Literal each CLUSTER_REGEXES match starts with, per field
+CLUSTER_KEYWORDS: Dict[str, str] = {
+    'replica_set_name': 'setName:',
+    'hosts': 'hosts:',
+    'primary_host': 'primary:'
 }
 
-DATABASE_REGEXES: Dict[str, str] = {
-    'database_name': r'\*\* DATABASE:\s*([^\s]+)'
+# Characters searched on either side of the first matched cluster field
+# before falling back to searching the whole log for the remaining fields
+CLUSTER_WINDOW_SIZE: int = 4096
+
+# Individual quoted host names inside a matched 'hosts' list
+HOSTS_TOKEN_REGEX: Pattern[str] = re.compile(r"'([^']+)'")
+
+# Database patterns are bytes patterns matched against the memory-mapped log.
+# Each captures its value in a group named after the field, so they can be
+# fused into a single alternation (see fuse_patterns for how that shapes the
+# records). They run over the whole buffer rather than one line, so they must
+# not match across newlines
+DATABASE_REGEXES: Dict[str, Pattern[bytes]] = {
+    'database_name': re.compile(rb'^\*\* DATABASE:[^\S\r\n]*(?P<database_name>\S+)')
+}
+
+# Literal every DATABASE_REGEXES match starts with
+DATABASE_LINE_PREFIX: bytes = b'** DATABASE:'
+
+# Bytes-like objects the database parser can scan
+Buffer = Union[bytes, mmap.mmap]
+
+# Parsed record as a CSV row, with values in the order of Parser.fieldnames.
+# Line numbers stay ints; csv.writer stringifies them on output
+Row = Tuple[Union[int, str], ...]
+
+# Database matches found in one span of a log: (line index relative to the
+# span start, field values in config order) pairs, plus the number of
+# newlines in the span
+DatabaseChunk = Tuple[List[Tuple[int, Tuple[str, ...]]], int]
+
+# Span of the log handed to each worker process when parsing in parallel
+PARALLEL_CHUNK_SIZE: int = 64 << 20
+
+# Write buffer for CSV output files, to batch rows into few write() calls
+CSV_WRITE_BUFFER_SIZE: int = 1 << 20
+
+# Compile flags fuse_patterns can carry over as a flag group scoped to one
+# alternative; ASCII is implied for bytes patterns and needs no group. The
+# constants come from the stdlib module since google-re2 defines none, and
+# its compiled patterns carry no flags to carry over
+SCOPED_FLAGS: Dict[int, bytes] = {
+    stdlib_re.IGNORECASE: b'i',
+    stdlib_re.MULTILINE: b'm',
+    stdlib_re.DOTALL: b's',
+    stdlib_re.VERBOSE: b'x'
 }
 
+# Leading global flag group such as (?i), which is only valid at the very
+# start of a pattern and so has to be folded into the alternative's scope
+GLOBAL_FLAGS_REGEX: Pattern[bytes] = stdlib_re.compile(rb'\(\?([a-zA-Z]+)\)')
+
+# Parser config entries may be given as pattern strings or compiled patterns
+PatternSource = Union[str, bytes, Pattern[Any]]
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: Union[str, bytes]) -> Pattern[Any]:
+    """
+    Compile a pattern string, reusing the compiled object for repeated patterns.
+    
+    Args:
+        pattern: Regular expression source
+        
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern)
+
+def compile_config(config: Mapping[str, Mapping[str, PatternSource]]) -> Dict[str, Dict[str, Pattern[Any]]]:
+    """
+    Compile every pattern string in a parser config; compiled patterns are kept as they are.
+    
+    Database patterns given as str are encoded to UTF-8 first, since database
+    logs are scanned as bytes.
+    
+    Args:
+        config: Parsing configuration with pattern strings or compiled patterns
+        
+    Returns:
+        Parsing configuration with compiled patterns only
+    """
+    compiled: Dict[str, Dict[str, Pattern[Any]]] = {}
+    
+    for parse_type, patterns in config.items():
+        compiled[parse_type] = {}
+        for field_name, pattern in patterns.items():
+            if isinstance(pattern, str) and parse_type == 'database':
+                pattern = pattern.encode('utf-8')
+            if isinstance(pattern, (str, bytes)):
+                pattern = compile_pattern(pattern)
+            compiled[parse_type][field_name] = pattern
+    
+    return compiled
+
+def named_groups(pattern: Pattern[Any]) -> Dict[str, int]:
+    """
+    Map the names of a pattern's named groups to their group numbers.
+    
+    google-re2 keys groupindex by bytes for bytes patterns, the stdlib always
+    by str; this returns str keys for both.
+    
+    Args:
+        pattern: Compiled pattern
+        
+    Returns:
+        Group name to group number mapping
+    """
+    return {
+        name.decode('utf-8') if isinstance(name, bytes) else name: index
+        for name, index in pattern.groupindex.items()
+    }
+
+def fuse_patterns(patterns: Dict[str, Pattern[bytes]]) -> Pattern[bytes]:
+    """
+    Combine per-field patterns into one multiline alternation so the log is scanned once.
+    
+    Each match of the fused pattern becomes one record. With a single field
+    (the default config) that is one record per matching line. With several
+    fields, a record holds the value of the field that matched and blanks for
+    the others; fields found on the same line are not merged into one record.
+    Input where no field matches produces no record.
+    
+    Args:
+        patterns: Field name to pattern mapping; each pattern must capture its
+            value in a group named after the field
+            
+    Returns:
+        Single compiled pattern whose named groups are the field names
+        
+    Raises:
+        ValueError: If a pattern uses flags that can't be scoped, or can't be
+            compiled as part of the alternation
+    """
+    alternatives: List[bytes] = []
+    scoped_letters = set(SCOPED_FLAGS.values())
+    
+    for field_name, pattern in patterns.items():
+        flags = getattr(pattern, 'flags', 0) & ~stdlib_re.ASCII
+        unsupported = flags & ~sum(SCOPED_FLAGS)
+        if unsupported:
+            logger.error("Database pattern for '%s' uses unsupported flags: %s", field_name, unsupported)
+            raise ValueError(f"Database pattern for '{field_name}' uses flags that can't be fused: {unsupported}")
+        
+        letters = {letter for flag, letter in SCOPED_FLAGS.items() if flags & flag}
+        source = pattern.pattern
+        
+        global_flags = GLOBAL_FLAGS_REGEX.match(source)
+        if global_flags:
+            source = source[global_flags.end():]
+            inline_letters = {bytes([letter]) for letter in global_flags.group(1)} - {b'a'}
+            if not inline_letters <= scoped_letters:
+                logger.error("Database pattern for '%s' uses unsupported inline flags", field_name)
+                raise ValueError(f"Database pattern for '{field_name}' uses inline flags that can't be fused")
+            letters |= inline_letters
+        
+        alternative = b'(?' + b''.join(sorted(letters)) + b':' + source + b')'
+        try:
+            re.compile(alternative)
+        except re.error as e:
+            logger.error("Database pattern for '%s' can't be fused: %s", field_name, e)
+            raise ValueError(f"Database pattern for '{field_name}' can't be fused: {e}") from e
+        alternatives.append(alternative)
+    
+    return re.compile(b'(?m)' + b'|'.join(alternatives))
+
+def field_extractor(pattern: Pattern[bytes]) -> Callable[[Match[bytes]], Tuple[str, ...]]:
+    """
+    Build a function that returns the decoded field values of a fused pattern match.
+    
+    The function is specialized once per pattern: with a single field (the
+    default database config) the group is read directly by index, instead of
+    looping over the groups for every match.
+    
+    Args:
+        pattern: Fused database pattern (see fuse_patterns)
+        
+    Returns:
+        Function mapping a match to its field values in config order
+    """
+    # Group numbers follow definition order, i.e. the config order
+    group_indexes = sorted(named_groups(pattern).values())
+    
+    if len(group_indexes) == 1:
+        group_index = group_indexes[0]
+        
+        def extract_single_field(match: Match[bytes]) -> Tuple[str, ...]:
+            return (str(match.group(group_index) or b'', 'utf-8', 'replace'),)
+        return extract_single_field
+    
+    def extract_fields(match: Match[bytes]) -> Tuple[str, ...]:
+        return tuple(str(match.group(index) or b'', 'utf-8', 'replace') for index in group_indexes)
+    return extract_fields
+
+def count_newlines(buffer: Buffer, start: int, end: int, window: int = 1 << 20) -> int:
+    """
+    Count newlines in buffer[start:end] without copying the whole range at once.
+    
+    Args:
+        buffer: Buffer to count in
+        start: Start offset (inclusive)
+        end: End offset (exclusive)
+        window: Number of bytes copied out of the buffer per step
+        
+    Returns:
+        Number of newline bytes in the range
+    """
+    return sum(buffer[pos:min(pos + window, end)].count(b'\n') for pos in range(start, end, window))
+
+def chunk_boundaries(buffer: Buffer, chunk_size: int) -> List[int]:
+    """
+    Split a buffer into spans of roughly chunk_size bytes that end on a newline.
+    
+    Args:
+        buffer: Buffer to split
+        chunk_size: Minimum size of each span except the last
+        
+    Returns:
+        Sorted offsets starting at 0 and ending at len(buffer); consecutive
+        offsets delimit one span
+    """
+    boundaries: List[int] = [0]
+    size = len(buffer)
+    pos = chunk_size
+    
+    while pos < size:
+        newline = buffer.find(b'\n', pos)
+        if newline == -1:
+            break
+        boundaries.append(newline + 1)
+        pos = newline + 1 + chunk_size
+    
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+def iter_prefixed_matches(
+    pattern: Pattern[bytes], buffer: Buffer, prefix: bytes, start: int, end: int
+) -> Iterator[Match[bytes]]:
+    """
+    Find pattern matches in buffer[start:end] by jumping between occurrences of a literal prefix.
+    
+    bytes.find/mmap.find are a tuned memmem, so the regex engine only runs at
+    candidate offsets instead of stepping over every byte of the buffer.
+    
+    Args:
+        pattern: Pattern whose matches all start with prefix
+        buffer: Buffer to scan
+        prefix: Non-empty literal that every match starts with
+        start: Start offset
+        end: End offset
+        
+    Yields:
+        Non-overlapping matches in buffer order
+    """
+    pos = buffer.find(prefix, start, end)
+    while pos != -1:
+        match = pattern.match(buffer, pos, end)
+        if match is not None:
+            yield match
+            pos = max(match.end(), pos + 1)
+        else:
+            pos += 1
+        pos = buffer.find(prefix, pos, end)
+
+def iter_database_matches(
+    pattern: Pattern[bytes], buffer: Buffer, start: int, end: int, prefix: bytes = b''
+) -> Iterator[Tuple[int, int, Tuple[str, ...]]]:
+    """
+    Find database matches in buffer[start:end], yielding each one as soon as it is scanned.
+    
+    Args:
+        pattern: Fused database pattern (see fuse_patterns)
+        buffer: Buffer to scan
+        start: Start offset; must be at the beginning of a line
+        end: End offset; must be at the end of a line or of the buffer
+        prefix: Literal every match starts with, or empty to let the regex scan everything
+        
+    Yields:
+        (line index relative to start, match offset, field values) per match
+    """
+    line_index = 0
+    last_pos = start
+    
+    if prefix:
+        found = iter_prefixed_matches(pattern, buffer, prefix, start, end)
+    else:
+        found = pattern.finditer(buffer, start, end)
+    
+    extract = field_extractor(pattern)
+    
+    for match in found:
+        # Line numbers are only needed for matches, so count lazily
+        line_index += count_newlines(buffer, last_pos, match.start())
+        last_pos = match.start()
+        yield line_index, last_pos, extract(match)
+
+def scan_database_buffer(
+    pattern: Pattern[bytes], buffer: Buffer, start: int, end: int, prefix: bytes = b''
+) -> DatabaseChunk:
+    """
+    Collect the database matches in buffer[start:end], for a worker process to send back.
+    
+    Args:
+        pattern: Fused database pattern (see fuse_patterns)
+        buffer: Buffer to scan
+        start: Start offset; must be at the beginning of a line
+        end: End offset; must be at the end of a line or of the buffer
+        prefix: Literal every match starts with, or empty to let the regex scan everything
+        
+    Returns:
+        Matches with line indexes relative to start, and the span's newline count
+    """
+    matches: List[Tuple[int, Tuple[str, ...]]] = []
+    line_index = 0
+    last_pos = start
+    
+    for line_index, last_pos, fields in iter_database_matches(pattern, buffer, start, end, prefix):
+        matches.append((line_index, fields))
+    
+    return matches, line_index + count_newlines(buffer, last_pos, end)
+
+def _scan_database_chunk(
+    file_path: str, pattern_source: bytes, prefix: bytes, start: int, end: int
+) -> DatabaseChunk:
+    """Worker entry point: map the file in this process and scan one span of it."""
+    with Path(file_path).open('rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return scan_database_buffer(re.compile(pattern_source), buffer, start, end, prefix)
+
 class Parser:
     """Parser for cluster and database information from log files."""
     
-    def __init__(self, config: Dict[str, Dict[str, str]]):
+    def __init__(
+        self,
+        config: Mapping[str, Mapping[str, PatternSource]],
+        database_prefix: bytes = b'',
+        cluster_keywords: Optional[Dict[str, str]] = None
+    ):
         """
         Initialize the parser with configuration parameters.
         
         Args:
-            config: Dictionary containing parsing configuration with regex patterns
+            config: Dictionary containing parsing configuration with regex patterns,
+                either compiled or as strings to be compiled once here
+            database_prefix: Literal every database match starts with, used to skip
+                ahead between candidates; empty to scan with the regex alone
+            cluster_keywords: Literal each cluster field's matches start with; fields
+                whose keyword is absent from the log are skipped without running the regex
+                
+        Raises:
+            ValueError: If a database pattern has no group named after its field,
+                or has other named groups that would widen its rows
         """
-        self.config: Dict[str, Dict[str, str]] = config
-        self.parsed_data: List[Dict[str, str]] = []
+        self.config: Dict[str, Dict[str, Pattern[Any]]] = compile_config(config)
+        
+        for field_name, pattern in self.config.get('database', {}).items():
+            group_names = set(named_groups(pattern))
+            if field_name not in group_names:
+                logger.error("Database pattern for '%s' has no group named '%s'", field_name, field_name)
+                raise ValueError(
+                    f"Database pattern for '{field_name}' must capture its value in a group named '{field_name}'"
+                )
+            if group_names != {field_name}:
+                extra_names = ', '.join(sorted(group_names - {field_name}))
+                logger.error("Database pattern for '%s' has extra named groups: %s", field_name, extra_names)
+                raise ValueError(
+                    f"Database pattern for '{field_name}' may only name the group '{field_name}', found: {extra_names}"
+                )
+        
+        self.database_pattern: Optional[Pattern[bytes]] = (
+            fuse_patterns(self.config['database']) if 'database' in self.config else None
+        )
+        self.database_prefix: bytes = database_prefix
+        self.cluster_keywords: Dict[str, str] = cluster_keywords or {}
+        # CSV columns per parse type; the schema is fully determined by the config
+        self.fieldnames: Dict[str, List[str]] = {
+            parse_type: (['line_number'] if parse_type == 'database' else []) + list(patterns)
+            for parse_type, patterns in self.config.items()
+        }
+        self.record_count: int = 0
+        self.first_record: Optional[Dict[str, Union[int, str]]] = None
 
-    def read_text_file(self, file_path: str) -> str:
+    def open_file(self, file_path: str, mode: str = 'r') -> IO[Any]:
         """
-        Read the content of a text file.
+        Open a file, as UTF-8 text unless a binary mode is given.
         
         Args:
-            file_path: Path to the text file
+            file_path: Path to the file
+            mode: File mode passed to open()
             
         Returns:
-            Content of the file as string
+            Open file handle; the caller is responsible for closing it
             
         Raises:
             FileNotFoundError: If the input file doesn't exist
-            IOError: If there's an error reading the file
+            IOError: If there's an error opening the file
         """
         try:
-            with Path(file_path).open('r', encoding='utf-8') as file:
-                return file.read()
+            return Path(file_path).open(mode, encoding=None if 'b' in mode else 'utf-8')
         except FileNotFoundError:
-            logger.error(f"File '{file_path}' not found")
+            logger.error("File '%s' not found", file_path)
             raise
         except IOError as e:
-            logger.error(f"Error reading file '{file_path}': {e}")
+            logger.error("Error opening file '%s': %s", file_path, e)
             raise
 
-    def parse_cluster_info(self, content: str) -> List[Dict[str, str]]:
+    def read_text_file(self, file_path: str) -> str:
+        """
+        Read the content of a text file.
+        
+        The file is read as bytes in one call and decoded in bulk, which avoids
+        the text layer's incremental decoding and newline translation. Invalid
+        UTF-8 sequences are replaced rather than failing the whole parse.
+        
+        Args:
+            file_path: Path to the text file
+            
+        Returns:
+            Content of the file as string
+            
+        Raises:
+            FileNotFoundError: If the input file doesn't exist
+            IOError: If there's an error reading the file
+        """
+        with self.open_file(file_path, 'rb') as file:
+            try:
+                return file.read().decode('utf-8', errors='replace')
+            except IOError as e:
+                logger.error("Error reading file '%s': %s", file_path, e)
+                raise
+
+    @contextmanager
+    def map_file(self, file_path: str) -> Iterator[Buffer]:
+        """
+        Memory-map a file read-only so it can be scanned without reading it into memory.
+        
+        Args:
+            file_path: Path to the file
+            
+        Yields:
+            Read-only buffer over the file content (empty bytes for an empty file)
+            
+        Raises:
+            FileNotFoundError: If the input file doesn't exist
+            IOError: If there's an error opening or mapping the file
+        """
+        with self.open_file(file_path, 'rb') as file:
+            if Path(file_path).stat().st_size == 0:
+                # mmap refuses to map zero-length files
+                yield b''
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def search_cluster_field(
+        self, field_name: str, pattern: Pattern[str], content: str, start: int = 0, end: Optional[int] = None
+    ) -> Optional[Match[str]]:
+        """
+        Search content[start:end] for one cluster field.
+        
+        Args:
+            field_name: Name of the field, used to look up its keyword
+            pattern: Pattern for the field
+            content: Text content to search
+            start: Start offset
+            end: End offset, or None for the end of content
+            
+        Returns:
+            First match, or None
+        """
+        end = len(content) if end is None else end
+        keyword = self.cluster_keywords.get(field_name)
+        # A match can't start before the keyword's first occurrence, so
+        # search from there, or not at all if the keyword is missing
+        pos = content.find(keyword, start, end) if keyword else start
+        return pattern.search(content, pos, end) if pos != -1 else None
+
+    def parse_cluster_info(self, content: str) -> List[Row]:
         """
         Parse cluster information from content.
         
+        The fields of a cluster description sit next to each other, so once one
+        field matched, the others are looked for in a small window around it
+        and only searched for in the whole content if they aren't there.
+        
         Args:
             content: Text content to parse
             
         Returns:
-            List of dictionaries containing parsed cluster data
+            List of rows containing parsed cluster data
         """
-        parsed_records: List[Dict[str, str]] = []
-        record: Dict[str, str] = {}
+        parsed_records: List[Row] = []
+        values: List[str] = []
+        window: Optional[Tuple[int, int]] = None
 
         for field_name, pattern in self.config['cluster'].items():
-            match = re.search(pattern, content)
-            if match:
-                if field_name == 'hosts':
-                    hosts = [
-                        host.strip().strip("'")
-                        for host in match.group(1).split(',')
-                        if host.strip()
-                    ]
-                    record[field_name] = ' | '.join(hosts)
-                else:
-                    record[field_name] = match.group(1).strip()
-
-        if record:
-            parsed_records.append(record)
+            match = None
+            if window is not None:
+                match = self.search_cluster_field(field_name, pattern, content, *window)
+            if match is None:
+                match = self.search_cluster_field(field_name, pattern, content)
+            if match is None:
+                values.append('')
+                continue
+
+            if window is None:
+                window = (max(0, match.start() - CLUSTER_WINDOW_SIZE), match.end() + CLUSTER_WINDOW_SIZE)
+            if field_name == 'hosts':
+                values.append(' | '.join(HOSTS_TOKEN_REGEX.findall(match.group(1))))
+            else:
+                values.append(match.group(1).strip())
+
+        if window is not None:
+            parsed_records.append(tuple(values))
 
         return parsed_records
 
-    def parse_database_info(self, content: str) -> List[Dict[str, str]]:
+    def merge_database_chunks(self, chunks: Iterable[DatabaseChunk]) -> Iterator[Row]:
         """
-        Parse database names from content.
+        Turn consecutive scanned spans into database rows with absolute line numbers.
         
         Args:
-            content: Text content to parse
+            chunks: Results of scan_database_buffer, in file order
             
-        Returns:
-            List of dictionaries containing parsed database data
+        Yields:
+            Rows containing parsed database data
         """
-        parsed_records: List[Dict[str, str]] = []
+        line_offset = 1
         
-        for line_num, line in enumerate(content.strip().split('\n'), 1):
-            record: Dict[str, str] = {'line_number': str(line_num)}
+        for matches, newlines in chunks:
+            for line_index, fields in matches:
+                yield (line_offset + line_index,) + fields
+            line_offset += newlines
+
+    def parse_database_info(self, buffer: Buffer) -> Iterator[Row]:
+        """
+        Parse database names from raw log bytes.
+        
+        Args:
+            buffer: Bytes to parse, e.g. a memory-mapped file
             
-            for field_name, pattern in self.config['database'].items():
-                match = re.search(pattern, line)
-                record[field_name] = match.group(1).strip() if match else ''
+        Yields:
+            Rows containing parsed database data, as they are found
             
-            if record.get('database_name'):
-                parsed_records.append(record)
+        Raises:
+            ValueError: If no database patterns are configured
+        """
+        if self.database_pattern is None:
+            logger.error("No database patterns configured")
+            raise ValueError("No database patterns configured")
         
-        return parsed_records
+        for line_index, _, fields in iter_database_matches(
+            self.database_pattern, buffer, 0, len(buffer), self.database_prefix
+        ):
+            yield (line_index + 1,) + fields
 
-    def parse_file(self, file_path: str, parse_type: str) -> List[Dict[str, str]]:
+    def parse_database_file(self, file_path: str, workers: int = 1) -> Iterator[Row]:
+        """
+        Parse database names from a log file, optionally across several processes.
+        
+        The file stays mapped until the returned records have been consumed.
+        Files smaller than two chunks are always parsed in this process, since
+        a single pass over a small anchored pattern is usually memory-bound already.
+        
+        Args:
+            file_path: Path to the log file
+            workers: Number of worker processes; 1 disables parallel parsing
+            
+        Yields:
+            Rows containing parsed database data
+            
+        Raises:
+            ValueError: If no database patterns are configured
+        """
+        if self.database_pattern is None:
+            logger.error("No database patterns configured")
+            raise ValueError("No database patterns configured")
+        
+        with self.map_file(file_path) as buffer:
+            if workers <= 1 or len(buffer) < 2 * PARALLEL_CHUNK_SIZE:
+                yield from self.parse_database_info(buffer)
+                return
+            boundaries = chunk_boundaries(buffer, PARALLEL_CHUNK_SIZE)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from self.merge_database_chunks(executor.map(
+                _scan_database_chunk,
+                repeat(file_path),
+                repeat(self.database_pattern.pattern),
+                repeat(self.database_prefix),
+                boundaries[:-1],
+                boundaries[1:]
+            ))
+
+    def parse_file(self, file_path: str, parse_type: str, workers: int = 1) -> Iterable[Row]:
         """
         Parse the text file based on the specified parse type.
         
         Args:
             file_path: Path to the text file to parse
             parse_type: Type of parsing ('cluster' or 'database')
+            workers: Number of worker processes for database parsing
             
         Returns:
-            List of parsed records
+            Parsed records as rows in fieldnames[parse_type] order; database records are
+            produced lazily as they are consumed
             
         Raises:
-            ValueError: If parse_type is invalid
+            ValueError: If parse_type is invalid or has no patterns configured
         """
-        content = self.read_text_file(file_path)
+        if parse_type in ('cluster', 'database') and parse_type not in self.config:
+            logger.error("No %s patterns configured", parse_type)
+            raise ValueError(f"No {parse_type} patterns configured")
         
         if parse_type == 'cluster':
-            self.parsed_data = self.parse_cluster_info(content)
+            content = self.read_text_file(file_path)
+            return self.parse_cluster_info(content)
         elif parse_type == 'database':
-            self.parsed_data = self.parse_database_info(content)
+            return self.parse_database_file(file_path, workers)
         else:
-            logger.error(f"Invalid parse type: {parse_type}")
+            logger.error("Invalid parse type: %s", parse_type)
             raise ValueError(f"Invalid parse type: {parse_type}")
+
+    def count_records(self, records: Iterable[Row]) -> Iterator[Row]:
+        """
+        Pass records through unchanged, counting them in record_count.
         
-        return self.parsed_data
+        Args:
+            records: Records to count
+            
+        Yields:
+            The same records
+        """
+        for record in records:
+            self.record_count += 1
+            yield record
 
-    def write_to_csv(self, output_file: Optional[str] = None) -> None:
+    def write_to_csv(
+        self, records: Iterable[Row], parse_type: str, output_file: Optional[str] = None
+    ) -> None:
         """
-        Write parsed data to CSV file or stdout.
+        Stream parsed records to CSV file or stdout.
+        
+        Updates record_count and first_record as a side effect.
         
         Args:
+            records: Records returned by parse_file
+            parse_type: Type of parsing the records came from ('cluster' or 'database')
             output_file: Path for the output CSV file, or None for stdout
             
         Raises:
             IOError: If there's an error writing to the output
         """
-        if not self.parsed_data:
+        records = iter(records)
+        first_row = next(records, None)
+        self.first_record = None
+        self.record_count = 0
+        
+        if first_row is None:
             logger.warning("No data to write to CSV")
             return
         
-        fieldnames: List[str] = sorted(set().union(*(record.keys() for record in self.parsed_data)))
+        fieldnames = self.fieldnames[parse_type]
+        self.first_record = dict(zip(fieldnames, first_row))
         
         try:
-            writer = csv.DictWriter(
-                sys.stdout if output_file is None else open(output_file, 'w', newline='', encoding='utf-8'),
-                fieldnames=fieldnames
-            )
-            writer.writeheader()
-            writer.writerows(self.parsed_data)
+            with (
+                nullcontext(sys.stdout) if output_file is None
+                else open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE)
+            ) as output:
+                writer = csv.writer(output)
+                writer.writerow(fieldnames)
+                writer.writerows(self.count_records(chain([first_row], records)))
             
-            logger.info(f"Successfully wrote {len(self.parsed_data)} records")
+            logger.info("Successfully wrote %d records", self.record_count)
             
         except IOError as e:
-            logger.error(f"Error writing to CSV: {e}")
+            logger.error("Error writing to CSV: %s", e)
             raise
-        finally:
-            if output_file is not None:
-                writer._dict_to_list(None).close()  # type: ignore
 
-def parse_arguments() -> Tuple[str, str]:
+def parse_arguments() -> Tuple[str, str, int]:
     """
     Parse command-line arguments.
     
     Returns:
-        Tuple of parse type and input file path
+        Tuple of parse type, input file path and number of worker processes
     
     Raises:
         SystemExit: If arguments are invalid
@@ -202,14 +746,25 @@ def parse_arguments() -> Tuple[str, str]:
         type=str,
         help="Path to the input log file"
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help="Worker processes for parsing large database logs (default: 1, 0: one per CPU)"
+    )
     
     args = parser.parse_args()
     
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive number")
+    
     if not Path(args.input_file).is_file():
-        logger.error(f"Input file '{args.input_file}' does not exist")
+        logger.error("Input file '%s' does not exist", args.input_file)
         sys.exit(1)
     
-    return args.parse_type, args.input_file
+    workers = args.jobs or os.cpu_count() or 1
+    
+    return args.parse_type, args.input_file, workers
 
 def main() -> None:
     """
@@ -219,32 +774,33 @@ def main() -> None:
         SystemExit: If an error occurs during processing
     """
     try:
-        parse_type, input_file = parse_arguments()
+        parse_type, input_file, workers = parse_arguments()
         
-        config = {
+        config: Mapping[str, Mapping[str, PatternSource]] = {
             'cluster': CLUSTER_REGEXES,
             'database': DATABASE_REGEXES
         }
         
-        logger.info(f"Parsing {parse_type} information from: {input_file}")
+        logger.info("Parsing %s information from: %s", parse_type, input_file)
         
-        parser = Parser(config)
-        parser.parse_file(input_file, parse_type)
-        parser.write_to_csv()
+        parser = Parser(config, DATABASE_LINE_PREFIX, CLUSTER_KEYWORDS)
+        records = parser.parse_file(input_file, parse_type, workers)
+        parser.write_to_csv(records, parse_type)
         
         logger.info("Parsing complete")
-        logger.info(f"Records processed: {len(parser.parsed_data)}")
+        logger.info("Records processed: %d", parser.record_count)
         
-        if parser.parsed_data:
+        # Per-item logging is guarded so nothing is formatted when INFO is disabled
+        if parser.first_record and logger.isEnabledFor(logging.INFO):
             logger.info("First record preview:")
-            for key, value in parser.parsed_data[0].items():
-                logger.info(f"  {key}: {value}")
+            for key, value in parser.first_record.items():
+                logger.info("  %s: %s", key, value)
                 
     except (ValueError, IOError) as e:
-        logger.error(f"Processing failed: {e}")
+        logger.error("Processing failed: %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
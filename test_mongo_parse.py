@@ -0,0 +1,159 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+import mongo_parse
+from mongo_parse import CLUSTER_KEYWORDS, CLUSTER_REGEXES, CLUSTER_WINDOW_SIZE, DATABASE_LINE_PREFIX, DATABASE_REGEXES, Parser
+
+
+def make_parser(database_prefix: bytes = DATABASE_LINE_PREFIX) -> Parser:
+    return Parser({'cluster': CLUSTER_REGEXES, 'database': DATABASE_REGEXES}, database_prefix)
+
+
+def parse_database(tmp_path: Path, content: bytes, database_prefix: bytes = DATABASE_LINE_PREFIX) -> list:
+    log_file = tmp_path / 'database.log'
+    log_file.write_bytes(content)
+    return list(make_parser(database_prefix).parse_file(str(log_file), 'database'))
+
+
+def test_database_lines_report_file_line_numbers(tmp_path):
+    content = b'\n** DATABASE: admin\nother\n** DATABASE: config\r\n'
+
+    assert parse_database(tmp_path, content) == [(2, 'admin'), (4, 'config')]
+
+
+def test_empty_database_line_does_not_match_next_line(tmp_path):
+    content = b'** DATABASE:\nfoo\n** DATABASE:   \n** DATABASE: bar\n'
+
+    assert parse_database(tmp_path, content) == [(4, 'bar')]
+    assert parse_database(tmp_path, content, database_prefix=b'') == [(4, 'bar')]
+
+
+def test_database_pattern_without_named_field_group_is_rejected():
+    config = {'cluster': CLUSTER_REGEXES, 'database': {'database_name': r'\*\* DATABASE:\s*([^\s]+)'}}
+
+    with pytest.raises(ValueError, match='database_name'):
+        Parser(config)
+
+
+def test_database_pattern_with_extra_named_group_is_rejected():
+    config = {'database': {'database_name': rb'^DB (?P<database_name>\S+) (?P<extra>\S+)'}}
+
+    with pytest.raises(ValueError, match='extra'):
+        Parser(config)
+
+
+def test_cluster_only_config(tmp_path):
+    log_file = tmp_path / 'cluster.log'
+    log_file.write_text("setName: 'rs0'\nhosts: [ 'a:1', 'b:2' ]\nprimary: 'a:1'\n")
+    parser = Parser({'cluster': CLUSTER_REGEXES})
+
+    assert parser.parse_file(str(log_file), 'cluster') == [('rs0', 'a:1 | b:2', 'a:1')]
+    with pytest.raises(ValueError):
+        parser.parse_file(str(log_file), 'database')
+
+
+def test_cluster_field_outside_window_is_found_in_whole_content():
+    content = "setName: 'rs0'\nhosts: [ 'a:1' ]\n" + 'x' * 2 * CLUSTER_WINDOW_SIZE + "\nprimary: 'a:1'\n"
+    parser = Parser({'cluster': CLUSTER_REGEXES}, cluster_keywords=CLUSTER_KEYWORDS)
+
+    assert parser.parse_cluster_info(content) == [('rs0', 'a:1', 'a:1')]
+
+
+def test_cluster_field_near_first_match_wins_over_earlier_one():
+    content = (
+        "hosts: [ 'stray:1' ]\n" + 'x' * 2 * CLUSTER_WINDOW_SIZE
+        + "\nsetName: 'rs0'\nhosts: [ 'a:1', 'b:2' ]\nprimary: 'a:1'\n"
+    )
+    parser = Parser({'cluster': CLUSTER_REGEXES}, cluster_keywords=CLUSTER_KEYWORDS)
+
+    assert parser.parse_cluster_info(content) == [('rs0', 'a:1 | b:2', 'a:1')]
+
+
+def test_cluster_field_with_absent_keyword_is_left_blank():
+    parser = Parser({'cluster': CLUSTER_REGEXES}, cluster_keywords=CLUSTER_KEYWORDS)
+
+    assert parser.parse_cluster_info("setName: 'rs0'\nprimary: 'a:1'\n") == [('rs0', '', 'a:1')]
+
+
+def test_cluster_keyword_without_match_does_not_hide_later_match():
+    parser = Parser({'cluster': CLUSTER_REGEXES}, cluster_keywords=CLUSTER_KEYWORDS)
+
+    assert parser.parse_cluster_info("setName: 'rs0'\nprimary: {}\nprimary: 'a:1'\n") == [('rs0', '', 'a:1')]
+
+
+def test_database_pattern_flags_are_kept(tmp_path):
+    log_file = tmp_path / 'database.log'
+    log_file.write_bytes(b'** database: admin\n')
+    config = {'database': {'database_name': re.compile(rb'^\*\* DATABASE:[ \t]*(?P<database_name>\S+)', re.IGNORECASE)}}
+
+    assert list(Parser(config).parse_file(str(log_file), 'database')) == [(1, 'admin')]
+
+
+@pytest.mark.parametrize('pattern', [
+    rb'(?i)^\*\* DATABASE:[ \t]*(?P<database_name>\S+)',
+    re.compile(rb'(?i)^\*\* DATABASE:[ \t]*(?P<database_name>\S+)')
+])
+def test_database_pattern_inline_global_flags_are_kept(tmp_path, pattern):
+    log_file = tmp_path / 'database.log'
+    log_file.write_bytes(b'** database: admin\n')
+
+    assert list(Parser({'database': {'database_name': pattern}}).parse_file(str(log_file), 'database')) == [(1, 'admin')]
+
+
+def test_multiple_database_fields_give_one_row_per_match(tmp_path):
+    log_file = tmp_path / 'database.log'
+    log_file.write_bytes(b'DB a\nCOLL b\nnothing\n')
+    config = {'database': {
+        'database_name': rb'^DB (?P<database_name>\S+)',
+        'collection_name': rb'^COLL (?P<collection_name>\S+)'
+    }}
+
+    assert list(Parser(config).parse_file(str(log_file), 'database')) == [(1, 'a', ''), (2, '', 'b')]
+
+
+def test_parallel_parsing_matches_single_process(tmp_path, monkeypatch):
+    lines = [b'** DATABASE: db%d' % i if i % 7 == 0 else b'filler line %d' % i for i in range(500)]
+    log_file = tmp_path / 'database.log'
+    log_file.write_bytes(b'\n'.join(lines) + b'\n')
+    monkeypatch.setattr(mongo_parse, 'PARALLEL_CHUNK_SIZE', 256)
+    parser = make_parser()
+
+    single = list(parser.parse_database_file(str(log_file), workers=1))
+    parallel = list(parser.parse_database_file(str(log_file), workers=3))
+
+    assert len(mongo_parse.chunk_boundaries(log_file.read_bytes(), 256)) > 3
+    assert parallel == single
+    assert single[:2] == [(1, 'db0'), (8, 'db7')]
+
+
+def test_negative_jobs_are_rejected(tmp_path, monkeypatch):
+    log_file = tmp_path / 'database.log'
+    log_file.write_bytes(b'')
+    monkeypatch.setattr(sys, 'argv', ['mongo_parse.py', '-j', '-3', 'database', str(log_file)])
+
+    with pytest.raises(SystemExit):
+        mongo_parse.parse_arguments()
+
+
+def test_write_to_csv_counts_records(tmp_path):
+    output_file = tmp_path / 'out.csv'
+    parser = make_parser()
+
+    parser.write_to_csv(iter([(1, 'admin'), (5, 'local')]), 'database', str(output_file))
+
+    assert output_file.read_bytes() == b'line_number,database_name\r\n1,admin\r\n5,local\r\n'
+    assert parser.record_count == 2
+    assert parser.first_record == {'line_number': 1, 'database_name': 'admin'}
+
+
+def test_google_re2_engine_parses_cluster_and_database(tmp_path):
+    pytest.importorskip('re2')
+    assert mongo_parse.re.__name__ == 're2'
+    cluster_file = tmp_path / 'cluster.log'
+    cluster_file.write_text("setName: 'rs0'\nhosts: [ 'a:1', 'b:2' ]\nprimary: 'a:1'\n")
+
+    assert make_parser().parse_file(str(cluster_file), 'cluster') == [('rs0', 'a:1 | b:2', 'a:1')]
+    assert parse_database(tmp_path, b'x\n** DATABASE: admin\n') == [(2, 'admin')]